@@ -1,38 +1,218 @@
 # scraper/google_maps_scraper.py
 
+import collections
+import functools
 import json
-import time
+import math
+import os
+import queue
+import re
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import orjson
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.firefox.options import Options
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     NoSuchElementException,
     TimeoutException,
     ElementClickInterceptedException,
     MoveTargetOutOfBoundsException,
+    WebDriverException,
 )
 from bs4 import BeautifulSoup
 
+# Approximate length of one degree of latitude in kilometers.
+KM_PER_DEGREE = 111.32
+# Below this cosine of the latitude a point is treated as being at a pole.
+POLE_COS_EPSILON = 1e-9
+
+# Maximum number of seconds to wait for the page to reach an expected state.
+WAIT_TIMEOUT = 10
+# Maximum number of seconds to wait for a navigation to finish.
+PAGE_LOAD_TIMEOUT = 20
+# Maximum number of seconds an asynchronous script may run, e.g. scrolling through reviews.
+SCRIPT_TIMEOUT = 300
+# Number of seconds without newly loaded reviews after which scrolling stops.
+REVIEW_IDLE_TIMEOUT = 2
+
+# Selectors for the Google Maps page elements the scraper reads.
+CLASS_LISTING = "hfpxzc"
+CLASS_LISTING_CARD = "Nv2PK"
+CLASS_RATING = "MW4etd"
+CLASS_REVIEW_COUNT = "UY7F9"
+CLASS_SERVICE = "Ahnjwc"
+CSS_DETAILS_PANEL = "div.RcCsl"
+CSS_REVIEWS_BUTTON = "button.hh2c6:nth-child(2)"
+CSS_REVIEW_SPAN = "div.MyEned > span.wiI7pd"
+CSS_SEARCH_BOX = "#searchboxinput"
+COOKIE_XPATH = "//button[@aria-label='Accept all']"
+COOKIE_FALLBACK_XPATH = "//button[contains(@aria-label, 'Accept all') or contains(text(), 'Accept all')]"
+
+# Business pages that can be opened directly from a listing's place identifiers.
+PLACE_ID_URL = "https://www.google.com/maps/place/?q=place_id:{}"
+PLACE_CID_URL = "https://www.google.com/maps?cid={}"
+
+# Search pages embed their results as JSON in the initial HTML response.
+APP_STATE_PATTERN = re.compile(r"window\.APP_INITIALIZATION_STATE=(.*?);window\.APP_FLAGS", re.DOTALL)
+# Prefix Google adds to JSON payloads to prevent them being executed as scripts.
+JSON_GUARD_PREFIX = ")]}'"
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Shared client so direct HTTP requests reuse keep-alive (HTTP/2) connections.
+SESSION = httpx.Client(
+    http2=True,
+    headers=HTTP_HEADERS,
+    follow_redirects=True,
+    timeout=httpx.Timeout(15.0, read=30.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+)
 
-def initialize_webdriver(headless=True):
+# Collects the side panel fields in a single WebDriver round-trip.
+BUSINESS_DETAILS_SCRIPT = """
+const text = (el) => el ? el.innerText : null;
+return {
+    website: document.querySelector('.PLbyfe a')?.href ?? null,
+    address: text(document.querySelector('div.RcCsl:nth-child(3) button:nth-child(2)')),
+    phone: text(document.querySelector('div.RcCsl:nth-child(5) button:nth-child(2)')),
+};
+"""
+
+# Scrolls through the reviews inside the browser and returns every review text
+# in one WebDriver call. Takes the review selector, the idle time in milliseconds
+# after which no more reviews are expected and the overall time limit in milliseconds.
+# Returns at once if no reviews are present.
+REVIEWS_SCROLL_SCRIPT = """
+const [selector, idleMs, maxMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = Date.now();
+let lastCount = -1;
+let idleSince = started;
+const collect = () => Array.from(document.querySelectorAll(selector)).map((el) => el.innerText);
+const tick = () => {
+    const elements = document.querySelectorAll(selector);
+    if (!elements.length) {
+        done([]);
+        return;
+    }
+    if (elements.length !== lastCount) {
+        lastCount = elements.length;
+        idleSince = Date.now();
+        if (elements.length) elements[elements.length - 1].scrollIntoView(true);
+    }
+    const now = Date.now();
+    if (now - idleSince >= idleMs || now - started >= maxMs) {
+        done(collect());
+        return;
+    }
+    setTimeout(tick, 250);
+};
+tick();
+"""
+
+
+def initialize_webdriver(headless=True, browser='chrome'):
     """
-    Initializes the Selenium WebDriver with Firefox options.
+    Initializes the Selenium WebDriver with Chrome or Firefox options.
+
+    Images are not loaded and navigations return once the DOM is ready, since
+    the scraper only reads the page's text and attributes. Chrome additionally
+    runs with browser logging disabled and requests a WebDriver BiDi connection.
 
     Args:
         headless (bool): If True, runs the browser in headless mode.
+        browser (str): Browser to drive ('chrome' or 'firefox').
 
     Returns:
         WebDriver: An instance of Selenium WebDriver.
     """
-    options = Options()
-    if headless:
-        options.add_argument("--headless")
-    driver = webdriver.Firefox(options=options)
+    if browser == 'chrome':
+        options = ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-logging")
+        options.add_argument("--log-level=3")
+        options.add_experimental_option("excludeSwitches", ["enable-logging"])
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        options.set_capability("webSocketUrl", True)
+    elif browser == 'firefox':
+        options = FirefoxOptions()
+        if headless:
+            options.add_argument("--headless")
+        options.set_preference("permissions.default.image", 2)
+    else:
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    options.page_load_strategy = "eager"
+    driver = webdriver.Chrome(options=options) if browser == 'chrome' else webdriver.Firefox(options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    driver.set_script_timeout(SCRIPT_TIMEOUT)
     return driver
 
 
+def initialize_driver_pool(size, headless=True, browser='chrome'):
+    """
+    Initializes a pool of WebDrivers for scraping listings concurrently.
+
+    Each browser opens Google Maps once so the cookie consent prompt is
+    dismissed before it is handed out to a worker.
+
+    Args:
+        size (int): Number of browser instances in the pool.
+        headless (bool): If True, runs the browsers in headless mode.
+        browser (str): Browser to drive ('chrome' or 'firefox').
+
+    Returns:
+        queue.Queue: A queue holding the WebDriver instances.
+    """
+    pool = queue.Queue()
+    try:
+        for _ in range(size):
+            driver = initialize_webdriver(headless=headless, browser=browser)
+            pool.put(driver)
+            driver.get("https://www.google.com/maps")
+            try:
+                # The consent prompt may only appear after a redirect, so wait for
+                # either the prompt or the Maps search box before checking for it
+                WebDriverWait(driver, WAIT_TIMEOUT).until(EC.any_of(
+                    EC.presence_of_element_located((By.XPATH, COOKIE_FALLBACK_XPATH)),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, CSS_SEARCH_BOX))
+                ))
+            except TimeoutException:
+                print("Google Maps did not finish loading in a pooled browser.")
+            dismiss_cookie_consent(driver)
+    except Exception:
+        # Don't leave the browsers started so far running
+        close_driver_pool(pool)
+        raise
+    return pool
+
+
+def close_driver_pool(pool):
+    """
+    Quits every WebDriver held by the pool.
+
+    Args:
+        pool (queue.Queue): The pool returned by initialize_driver_pool, or None.
+    """
+    if pool is None:
+        return
+    while not pool.empty():
+        try:
+            pool.get_nowait().quit()
+        except WebDriverException as e:
+            print(f"Error closing pooled WebDriver: {e}")
+
+
+@functools.lru_cache(maxsize=4096)
 def format_coordinates(latitude, longitude):
     """
     Formats latitude and longitude with directional indicators without rounding.
@@ -51,6 +231,7 @@ def format_coordinates(latitude, longitude):
     return formatted_lat, formatted_lon
 
 
+@functools.lru_cache(maxsize=4096)
 def build_search_url(business_type, distance, latitude, longitude, unit='km'):
     """
     Constructs the Google Maps search URL based on provided parameters.
@@ -80,159 +261,174 @@ def dismiss_cookie_consent(driver):
         driver (WebDriver): The Selenium WebDriver instance.
     """
     try:
-        consent_button = driver.find_element(
-            By.XPATH,
-            "//button[contains(@aria-label, 'Accept all') or contains(text(), 'Accept all')]"
-        )
+        try:
+            consent_button = driver.find_element(By.XPATH, COOKIE_XPATH)
+        except NoSuchElementException:
+            consent_button = driver.find_element(By.XPATH, COOKIE_FALLBACK_XPATH)
         consent_button.click()
         print("Cookie consent dismissed.")
     except NoSuchElementException:
         print("No cookie consent prompt found.")
 
 
-def extract_business_details(driver, index):
+def extract_business_details(driver, index, place_url=None):
     """
-    Extracts detailed information about a business from Google Maps.
+    Opens a business entry on Google Maps and extracts the details shown in its side panel.
+
+    Fields available on the listing card itself (name, rating, reviews, service) are
+    parsed from the page source in scrape_google_maps instead.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
         index (int): Index of the business entry.
+        place_url (str): URL of the business page. If given, the page is opened
+            directly instead of clicking the entry in the current result list.
 
     Returns:
-        dict: A dictionary containing business details.
+        dict: A dictionary containing the side panel details.
     """
     try:
-        entries = driver.find_elements(By.CLASS_NAME, "hfpxzc")
-        entry = entries[index]
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", entry)
-        time.sleep(1)
-        ActionChains(driver).move_to_element(entry).click(entry).perform()
-        time.sleep(2)
+        if place_url:
+            driver.get(place_url)
+        else:
+            # The previous listing's panel stays in the DOM until the new one replaces it
+            previous_panels = driver.find_elements(By.CSS_SELECTOR, CSS_DETAILS_PANEL)
+            entries = driver.find_elements(By.CLASS_NAME, CLASS_LISTING)
+            entry = entries[index]
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", entry)
+            ActionChains(driver).move_to_element(entry).click(entry).perform()
+            if previous_panels:
+                WebDriverWait(driver, WAIT_TIMEOUT).until(EC.staleness_of(previous_panels[0]))
+        WebDriverWait(driver, WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, CSS_DETAILS_PANEL))
+        )
 
         # Extracting details
-        name = entry.get_attribute('aria-label') or 'N/A'
-        rating = get_element_text(driver, By.CLASS_NAME, 'MW4etd', index) + "/5" if get_element_text(driver, By.CLASS_NAME, 'MW4etd', index) else 'N/A'
-        reviews = get_element_text(driver, By.CLASS_NAME, 'UY7F9', index) or 'N/A'
-        service = get_element_text(driver, By.CLASS_NAME, 'Ahnjwc', index) or 'N/A'
-        website = get_element_attribute(driver, By.CSS_SELECTOR, ".PLbyfe a", 'href') or 'N/A'
-        address = get_element_text(driver, By.CSS_SELECTOR, "div.RcCsl:nth-child(3) button:nth-child(2)", 0) or 'N/A'
-        phone = get_element_text(driver, By.CSS_SELECTOR, "div.RcCsl:nth-child(5) button:nth-child(2)", 0) or 'N/A'
+        details = driver.execute_script(BUSINESS_DETAILS_SCRIPT) or {}
+        website = details.get('website') or 'N/A'
+        address = details.get('address') or 'N/A'
+        phone = details.get('phone') or 'N/A'
 
         # Click reviews button
+        all_reviews = []
         try:
-            reviews_button = driver.find_element(By.CSS_SELECTOR, "button.hh2c6:nth-child(2)")
+            previous_reviews = driver.find_elements(By.CSS_SELECTOR, CSS_REVIEW_SPAN)
+            reviews_button = driver.find_element(By.CSS_SELECTOR, CSS_REVIEWS_BUTTON)
             reviews_button.click()
-            time.sleep(2)
+            if previous_reviews:
+                WebDriverWait(driver, WAIT_TIMEOUT).until(EC.staleness_of(previous_reviews[0]))
+            WebDriverWait(driver, WAIT_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, CSS_REVIEW_SPAN))
+            )
+            # Extract reviews
+            all_reviews = scrape_reviews(driver)
         except NoSuchElementException:
             print("Reviews button not found.")
-
-        # Extract reviews
-        all_reviews = scrape_reviews(driver)
+        except TimeoutException:
+            print("Reviews did not load in time.")
 
         return {
-            'name': name,
-            'rating': rating,
-            'reviews': reviews,
-            'service': service,
             'website': website,
             'address': address,
             'phone': phone,
             'all_reviews': all_reviews
         }
 
-    except (NoSuchElementException, ElementClickInterceptedException, MoveTargetOutOfBoundsException, IndexError) as e:
+    except (NoSuchElementException, ElementClickInterceptedException, MoveTargetOutOfBoundsException, IndexError, TimeoutException) as e:
         print(f"Error extracting details for entry {index}: {e}")
         return {}
 
 
-def get_element_text(driver, by, selector, index=0):
+def get_soup_text(card, class_name):
     """
-    Retrieves text from a specified element.
+    Retrieves stripped text from an element inside a parsed listing card.
 
     Args:
-        driver (WebDriver): The Selenium WebDriver instance.
-        by (By): The method to locate elements.
-        selector (str): The selector string.
-        index (int): The index of the element if multiple are found.
+        card (Tag): The parsed listing card.
+        class_name (str): Class of the element to read.
 
     Returns:
         str: Text content of the element or None.
     """
-    try:
-        elements = driver.find_elements(by, selector)
-        return elements[index].text if elements else None
-    except IndexError:
+    element = card.find(class_=class_name)
+    if element is None:
         return None
+    return element.get_text(strip=True) or None
 
 
-def get_element_attribute(driver, by, selector, attribute, index=0):
+def scrape_reviews(driver):
     """
-    Retrieves an attribute from a specified element.
+    Scrapes all available reviews from the reviews section.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
-        by (By): The method to locate elements.
-        selector (str): The selector string.
-        attribute (str): The attribute to retrieve.
-        index (int): The index of the element if multiple are found.
 
     Returns:
-        str: Attribute value of the element or None.
+        list: A list of review texts.
     """
     try:
-        elements = driver.find_elements(by, selector)
-        return elements[index].get_attribute(attribute) if elements else None
-    except IndexError:
-        return None
+        # Stop a little before the script timeout so the reviews loaded so far are returned
+        texts = driver.execute_async_script(
+            REVIEWS_SCROLL_SCRIPT,
+            CSS_REVIEW_SPAN,
+            REVIEW_IDLE_TIMEOUT * 1000,
+            (SCRIPT_TIMEOUT - WAIT_TIMEOUT) * 1000
+        )
+    except Exception as e:
+        print(f"Error while scraping reviews: {e}")
+        return []
+
+    reviews = []
+    seen = set()
+    for text in texts:
+        if text not in seen:
+            seen.add(text)
+            reviews.append(text)
+    return reviews
 
 
-def scrape_reviews(driver):
+def get_place_url(title):
     """
-    Scrapes all available reviews from the reviews section.
+    Builds the URL of a business page from its listing anchor.
 
     Args:
-        driver (WebDriver): The Selenium WebDriver instance.
+        title (Tag): The parsed listing anchor element.
 
     Returns:
-        list: A list of review texts.
+        str: URL that opens the business page directly, or None if the listing
+            exposes no place identifier or link.
     """
-    reviews = []
-    seen = set()
-    while True:
-        try:
-            review_elements = driver.find_elements(By.CSS_SELECTOR, "div.MyEned > span.wiI7pd")
-            new_reviews = 0
-            for elem in review_elements:
-                text = elem.text
-                if text not in seen:
-                    seen.add(text)
-                    reviews.append(text)
-                    new_reviews += 1
-            if new_reviews > 0:
-                driver.execute_script("arguments[0].scrollIntoView(true);", review_elements[-1])
-                time.sleep(2)
-            else:
-                print("No more new reviews found.")
-                break
-        except Exception as e:
-            print(f"Error while scraping reviews: {e}")
-            break
-    return reviews
+    if title.get('data-pid'):
+        return PLACE_ID_URL.format(title['data-pid'])
+    if title.get('data-cid'):
+        return PLACE_CID_URL.format(title['data-cid'])
+    return title.get('href')
 
 
-def scrape_google_maps(driver, url):
+def scrape_google_maps(driver, url, pool=None):
     """
     Scrapes business data from Google Maps based on the provided search URL.
 
+    Listings are opened directly by their place URL where one is available;
+    the rest are clicked in the result list before navigating away from it.
+
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
         url (str): Google Maps search URL.
+        pool (queue.Queue): Optional pool of WebDrivers. If given and not empty,
+            listings with a place URL are opened in pooled browsers and scraped concurrently.
 
     Returns:
         list: A list of dictionaries containing business details.
     """
-    driver.get(url)
-    time.sleep(3)  # Allow the page to load
+    try:
+        driver.get(url)
+        # Allow the page to load the result listings
+        WebDriverWait(driver, WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.CLASS_NAME, CLASS_LISTING))
+        )
+    except TimeoutException:
+        print(f"No listings loaded for {url}")
 
     dismiss_cookie_consent(driver)
 
@@ -240,76 +436,313 @@ def scrape_google_maps(driver, url):
     page_source = driver.page_source
     soup = BeautifulSoup(page_source, "html.parser")
 
-    titles = soup.find_all(class_="hfpxzc")
-    ratings = soup.find_all(class_='MW4etd')
-    reviews = soup.find_all(class_='UY7F9')
-    services = soup.find_all(class_='Ahnjwc')
+    titles = soup.find_all(class_=CLASS_LISTING)
+    place_urls = [get_place_url(title) for title in titles]
+
+    def worker(i, worker_driver=driver):
+        # Listing card fields come straight from the parsed page source
+        # Read each field inside the listing's own card so a missing field is not
+        # filled in from a neighbouring listing
+        card = titles[i].find_parent(class_=CLASS_LISTING_CARD) or titles[i].parent
+        rating = get_soup_text(card, CLASS_RATING)
+        business = {
+            'name': titles[i].get('aria-label') or 'N/A',
+            'rating': f"{rating}/5" if rating else 'N/A',
+            'reviews': get_soup_text(card, CLASS_REVIEW_COUNT) or 'N/A',
+            'service': get_soup_text(card, CLASS_SERVICE) or 'N/A',
+        }
+
+        # Only the side panel fields require driving the browser
+        details = extract_business_details(worker_driver, i, place_urls[i])
+        if not details:
+            return None
+        business.update(details)
+        print(f"Scraped business: {business['name']}")
+        return business
+
+    def pooled_worker(i):
+        worker_driver = pool.get()
+        try:
+            return worker(i, worker_driver)
+        finally:
+            pool.put(worker_driver)
+
+    # Listings without a place URL must be clicked while the result list is still loaded
+    click_indices = [i for i, place_url in enumerate(place_urls) if not place_url]
+    url_indices = [i for i, place_url in enumerate(place_urls) if place_url]
+
+    scraped = {i: worker(i) for i in click_indices}
+    # An empty pool has no browsers to hand out, so scrape on the main driver
+    if pool is None or pool.empty():
+        scraped.update((i, worker(i)) for i in url_indices)
+    else:
+        with ThreadPoolExecutor(max_workers=pool.qsize()) as executor:
+            scraped.update(zip(url_indices, executor.map(pooled_worker, url_indices)))
+
+    return [scraped[i] for i in range(len(titles)) if scraped[i]]
+
+
+def get_nested_value(data, *path):
+    """
+    Retrieves a value from nested lists by following a path of indices.
+
+    Args:
+        data (list): The nested list structure.
+        *path (int): Indices to follow.
+
+    Returns:
+        Any: The value at the given path or None if the path does not exist.
+    """
+    for key in path:
+        try:
+            data = data[key]
+        except (IndexError, KeyError, TypeError):
+            return None
+    return data
+
+
+def parse_search_results(html):
+    """
+    Parses business records from the JSON embedded in a Google Maps search page.
+
+    The payload is an undocumented nest of positional arrays. The index paths
+    below were read off search page responses and will break if Google changes
+    the layout, in which case None is returned so the caller can fall back to
+    the browser.
+
+    Args:
+        html (str): HTML of the search page.
+
+    Returns:
+        list: A list of dictionaries containing business details, or None if the
+            embedded JSON could not be found or parsed.
+    """
+    match = APP_STATE_PATTERN.search(html)
+    if not match:
+        return None
+
+    try:
+        state = json.loads(match.group(1))
+        # state[3][2] holds the search response as a JSON string behind the guard prefix
+        payload = get_nested_value(state, 3, 2)
+        if not isinstance(payload, str):
+            return None
+        if payload.startswith(JSON_GUARD_PREFIX):
+            payload = payload[len(JSON_GUARD_PREFIX):]
+        data = json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+
+    # data[0][1] is the list of result rows; rows that are not places (e.g. the
+    # leading metadata row) have no place record at [14]
+    listings = get_nested_value(data, 0, 1)
+    if not isinstance(listings, list):
+        return None
 
     results = []
-    for i in range(len(titles)):
-        business = extract_business_details(driver, i)
-        if business:
-            results.append(business)
-            print(f"Scraped business: {business['name']}")
+    for listing in listings:
+        place = get_nested_value(listing, 14)
+        if not isinstance(place, list):
+            continue
+
+        # [11]: business name
+        name = get_nested_value(place, 11)
+        if not isinstance(name, str) or not name:
+            continue
+        # [4]: rating summary, with the average rating at [7] and review count at [8]
+        rating = get_nested_value(place, 4, 7)
+        reviews = get_nested_value(place, 4, 8)
+        # [13]: list of categories, the first being the primary one shown on the card
+        services = get_nested_value(place, 13)
+
+        results.append({
+            'name': name,
+            'rating': f"{rating}/5" if rating else 'N/A',
+            'reviews': f"({reviews})" if reviews else 'N/A',
+            'service': services[0] if isinstance(services, list) and services else 'N/A',
+            # [7][0]: website URL
+            'website': get_nested_value(place, 7, 0) or 'N/A',
+            # [39]: full address, [18]: "name, address" string used when [39] is missing
+            'address': get_nested_value(place, 39) or get_nested_value(place, 18) or 'N/A',
+            # [178][0][0]: phone number as displayed
+            'phone': get_nested_value(place, 178, 0, 0) or 'N/A',
+            'all_reviews': []
+        })
+
+    # Rows without a single recognizable place mean the layout has changed
+    if listings and not results:
+        return None
 
     return results
 
 
-def save_to_json(data, filepath):
+def scrape_google_maps_http(url):
     """
-    Saves scraped data to a JSON file, avoiding duplicates.
+    Scrapes business data from the search page HTML without starting a browser.
+
+    Reviews are only shown after interacting with the page, so 'all_reviews'
+    is always empty for results from this function.
 
     Args:
-        data (list): List of business dictionaries.
-        filepath (str): Path to the JSON file.
+        url (str): Google Maps search URL.
+
+    Returns:
+        list: A list of dictionaries containing business details, or None if the
+            page could not be fetched or parsed.
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            existing_data = json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
-        existing_data = []
+        response = SESSION.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"HTTP request failed for {url}: {e}")
+        return None
+
+    return parse_search_results(response.text)
+
+
+def load_saved_names(filepath):
+    """
+    Reads the names of businesses already saved to a JSON Lines file.
+
+    The file is streamed line by line so the saved entries are never held in memory.
+
+    Args:
+        filepath (str): Path to the JSON Lines file.
+
+    Returns:
+        set: Names of the saved businesses.
+    """
+    names = set()
+    if not os.path.exists(filepath):
+        return names
+
+    with open(filepath, 'rb') as file:
+        for line in file:
+            try:
+                names.add(orjson.loads(line)['name'])
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                continue
+    return names
+
+
+def save_to_json(data, filepath, saved_names=None):
+    """
+    Appends scraped data to a JSON Lines file, avoiding duplicates.
+
+    Args:
+        data (list): List of business dictionaries.
+        filepath (str): Path to the JSON Lines file.
+        saved_names (set): Names already saved to the file. Updated with the new
+            entries. If None, the names are read from the file.
+    """
+    if saved_names is None:
+        saved_names = load_saved_names(filepath)
 
-    existing_names = {entry['name'] for entry in existing_data}
-    new_entries = [entry for entry in data if entry['name'] not in existing_names]
+    new_entries = []
+    for entry in data:
+        if entry['name'] not in saved_names:
+            saved_names.add(entry['name'])
+            new_entries.append(entry)
 
     if new_entries:
-        existing_data.extend(new_entries)
-        with open(filepath, 'w', encoding='utf-8') as file:
-            json.dump(existing_data, file, indent=4, ensure_ascii=False)
+        with open(filepath, 'ab') as file:
+            for entry in new_entries:
+                file.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
         print(f"Saved {len(new_entries)} new entries to {filepath}")
     else:
         print("No new entries to save.")
 
 
-def recursive_search(driver, business_type, distance, latitude, longitude, filepath, seen_data, min_results=10, unit='km'):
+def offset_points(latitude, longitude, distance_km):
+    """
+    Computes the search points north, south, east and west of a center.
+
+    Latitudes are clamped to [-90, 90] and longitudes wrapped to [-180, 180).
+    East and West points are omitted at the poles, where a longitude offset
+    has no meaningful size.
+
+    Args:
+        latitude (float): Latitude of the center.
+        longitude (float): Longitude of the center.
+        distance_km (float): Distance of each point from the center in kilometers.
+
+    Returns:
+        list: (latitude, longitude) tuples of the new search points.
+    """
+    dlat = distance_km / KM_PER_DEGREE
+    points = [
+        (min(latitude + dlat, 90.0), longitude),    # North
+        (max(latitude - dlat, -90.0), longitude),   # South
+    ]
+
+    cos_lat = abs(math.cos(math.radians(latitude)))
+    if cos_lat >= POLE_COS_EPSILON:
+        dlon = distance_km / (KM_PER_DEGREE * cos_lat)
+        points.extend([
+            (latitude, longitude + dlon),   # East
+            (latitude, longitude - dlon),   # West
+        ])
+
+    return [(lat, (lon + 180.0) % 360.0 - 180.0) for lat, lon in points]
+
+
+def recursive_search(driver, business_type, distance, latitude, longitude, filepath, seen_data, min_results=10, unit='km', pool=None, use_http=False, visited_urls=None, saved_names=None):
     """
-    Recursively searches Google Maps within specified distances to gather business data.
+    Searches Google Maps within progressively smaller areas to gather business data.
+
+    Areas are explored breadth-first from a work queue: whenever an area yields at
+    least min_results new businesses, four smaller areas around its center are queued.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
         business_type (str): Type of business to search for.
-        distance (int): Current search distance.
-        latitude (float): Latitude of the search center.
-        longitude (float): Longitude of the search center.
-        filepath (str): Path to the JSON file for saving results.
+        distance (int): Initial search distance.
+        latitude (float): Latitude of the initial search center.
+        longitude (float): Longitude of the initial search center.
+        filepath (str): Path to the JSON Lines file for saving results.
         seen_data (dict): Dictionary to track seen businesses.
-        min_results (int): Minimum number of new results to continue recursion.
+        min_results (int): Minimum number of new results needed to refine an area.
         unit (str): Unit of distance ('km' or 'm').
+        pool (queue.Queue): Optional pool of WebDrivers for scraping listings concurrently.
+        use_http (bool): If True, reads results from the search page HTML first and
+            only falls back to the browser when it cannot be parsed.
+        visited_urls (set): Search URLs already scraped.
+        saved_names (set): Names already saved to filepath.
     """
-    search_url = build_search_url(business_type, distance, latitude, longitude, unit)
-    print(f"Searching: {search_url}")
-    scraped_data = scrape_google_maps(driver, search_url)
+    if visited_urls is None:
+        visited_urls = set()
+    if saved_names is None:
+        saved_names = load_saved_names(filepath)
+
+    todo = collections.deque([(distance, latitude, longitude, unit)])
+    visited_areas = {(round(latitude, 4), round(longitude, 4), distance, unit)}
 
-    # Filter new entries
-    new_data = []
-    for entry in scraped_data:
-        if entry['name'] not in seen_data:
-            seen_data[entry['name']] = entry
-            new_data.append(entry)
+    while todo:
+        distance, latitude, longitude, unit = todo.popleft()
 
-    save_to_json(new_data, filepath)
+        search_url = build_search_url(business_type, distance, latitude, longitude, unit)
+        if search_url in visited_urls:
+            print(f"Skipping already searched area: {search_url}")
+            continue
+        visited_urls.add(search_url)
+
+        print(f"Searching: {search_url}")
+        scraped_data = scrape_google_maps_http(search_url) if use_http else None
+        if scraped_data is None:
+            scraped_data = scrape_google_maps(driver, search_url, pool)
+
+        # Filter new entries
+        new_data = []
+        for entry in scraped_data:
+            if entry['name'] not in seen_data:
+                seen_data[entry['name']] = entry
+                new_data.append(entry)
+
+        save_to_json(new_data, filepath, saved_names)
+
+        if len(new_data) < min_results:
+            continue
 
-    if len(new_data) >= min_results:
         print(f"Refining search area for distance {distance} {unit}.")
         if unit == 'km' and distance > 1:
             new_distance = distance // 2
@@ -318,45 +751,44 @@ def recursive_search(driver, business_type, distance, latitude, longitude, filep
             new_distance = distance * 1000 if unit == 'km' else distance // 2
             new_unit = 'm'
 
+        # The area cannot be narrowed any further
+        if new_distance < 1:
+            continue
+
         # Define new search points around the current center
-        offsets = [
-            (latitude + new_distance / 111.32, longitude),       # North
-            (latitude - new_distance / 111.32, longitude),       # South
-            (latitude, longitude + new_distance / (111.32 * abs(math.cos(math.radians(latitude))))) if math.cos(math.radians(latitude)) != 0 else longitude,  # East
-            (latitude, longitude - new_distance / (111.32 * abs(math.cos(math.radians(latitude))))) if math.cos(math.radians(latitude)) != 0 else longitude,  # West
-        ]
+        distance_km = new_distance / 1000 if new_unit == 'm' else new_distance
+        offsets = offset_points(latitude, longitude, distance_km)
 
         for new_lat, new_lon in offsets:
-            recursive_search(
-                driver,
-                business_type,
-                new_distance,
-                new_lat,
-                new_lon,
-                filepath,
-                seen_data,
-                min_results,
-                new_unit
-            )
+            area = (round(new_lat, 4), round(new_lon, 4), new_distance, new_unit)
+            if area not in visited_areas:
+                visited_areas.add(area)
+                todo.append((new_distance, new_lat, new_lon, new_unit))
 
 
 def main():
-    import math
-
     # User inputs
     business_type = "factories"       # Example business type
     initial_distance = 5              # Initial distance
     latitude = 41.8781                 # Example latitude (Chicago)
     longitude = -87.6298               # Example longitude (Chicago)
-    json_filepath = 'GoogleMapsData.json'
+    json_filepath = 'GoogleMapsData.jsonl'
+    pool_size = 4                      # Number of browsers scraping listings concurrently
+    use_http = False                   # Set True to skip the browser where possible (no reviews)
+    browser = 'chrome'                 # 'chrome' or 'firefox'
 
     # Initialize WebDriver
-    driver = initialize_webdriver(headless=False)  # Set headless=True to run without a browser window
+    driver = initialize_webdriver(headless=False, browser=browser)  # Set headless=True to run without a browser window
+    pool = None
 
     # Dictionary to track seen businesses
     seen_businesses = {}
 
     try:
+        # The HTTP path falls back to the main driver only, so it needs no pool
+        if not use_http:
+            pool = initialize_driver_pool(pool_size, browser=browser)
+
         recursive_search(
             driver,
             business_type,
@@ -364,9 +796,12 @@ def main():
             latitude,
             longitude,
             json_filepath,
-            seen_businesses
+            seen_businesses,
+            pool=pool,
+            use_http=use_http
         )
     finally:
+        close_driver_pool(pool)
         driver.quit()
         print("WebDriver closed.")
 
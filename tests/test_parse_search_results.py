@@ -0,0 +1,79 @@
+import json
+
+from scraper.google_maps_scraper import JSON_GUARD_PREFIX, parse_search_results
+
+
+def make_place(name, rating=None, reviews=None, services=None, website=None, address=None, phone=None):
+    """Builds a trimmed place record with fields at the indices Google uses."""
+    place = [None] * 179
+    place[4] = [None] * 7 + [rating, reviews]
+    place[7] = [website] if website else None
+    place[11] = name
+    place[13] = services
+    place[39] = address
+    place[178] = [[phone]] if phone else None
+    return place
+
+
+def make_page(listings, guard=True):
+    """Wraps result rows in a trimmed APP_INITIALIZATION_STATE script."""
+    payload = json.dumps([[None, listings]])
+    if guard:
+        payload = JSON_GUARD_PREFIX + "\n" + payload
+    state = [None, None, None, [None, None, payload]]
+    return (
+        "<html><script>window.APP_INITIALIZATION_STATE="
+        + json.dumps(state)
+        + ";window.APP_FLAGS=[];</script></html>"
+    )
+
+
+def test_parses_place_fields_behind_guard_prefix():
+    place = make_place(
+        "Acme Factory",
+        rating=4.5,
+        reviews=120,
+        services=["Manufacturer", "Supplier"],
+        website="https://acme.example",
+        address="1 Main St, Chicago, IL",
+        phone="(312) 555-0100",
+    )
+
+    results = parse_search_results(make_page([[None] * 14 + [place]]))
+
+    assert results == [{
+        'name': "Acme Factory",
+        'rating': "4.5/5",
+        'reviews': "(120)",
+        'service': "Manufacturer",
+        'website': "https://acme.example",
+        'address': "1 Main St, Chicago, IL",
+        'phone': "(312) 555-0100",
+        'all_reviews': [],
+    }]
+
+
+def test_parses_payload_without_guard_prefix():
+    results = parse_search_results(make_page([[None] * 14 + [make_place("Acme Factory")]], guard=False))
+
+    assert [entry['name'] for entry in results] == ["Acme Factory"]
+    assert results[0]['rating'] == 'N/A'
+    assert results[0]['phone'] == 'N/A'
+
+
+def test_skips_rows_without_place_record_and_name():
+    metadata_row = ["metadata"]
+    unnamed = [None] * 14 + [make_place(None)]
+    named = [None] * 14 + [make_place("Acme Factory")]
+
+    results = parse_search_results(make_page([metadata_row, unnamed, named]))
+
+    assert [entry['name'] for entry in results] == ["Acme Factory"]
+
+
+def test_returns_none_when_no_row_is_a_place():
+    assert parse_search_results(make_page([["metadata"], [None] * 14 + [make_place(None)]])) is None
+
+
+def test_returns_none_without_embedded_state():
+    assert parse_search_results("<html></html>") is None